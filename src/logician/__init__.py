@@ -17,6 +17,7 @@ supplying the logger class to perform delegation onto by this library.
 """
 
 from logging import Logger
+from weakref import WeakValueDictionary
 
 
 # region base re-exports
@@ -49,11 +50,36 @@ To get a local instance use ``errmsg_creator.clone_with(...)``.
 """
 
 
+_direct_all_level_loggers: WeakValueDictionary[Logger, DirectStdAllLevelLogger] = (
+    WeakValueDictionary()
+)
+"""
+std logger -> its logician logger, for the logician loggers still in use. Lets repeated
+``get_direct_all_level_logger()`` calls for a logger share one logician logger.
+"""
+
+
 def get_direct_all_level_logger(logger: Logger) -> DirectStdAllLevelLogger:
     """
     Simple logger configurator to directly configure a std logger to logician standards.
 
+    Examples:
+
+    >>> import logging
+    >>> lgr = get_direct_all_level_logger(logging.getLogger("lgcn-direct"))
+    >>> assert lgr is get_direct_all_level_logger(logging.getLogger("lgcn-direct"))
+
+    The shared logician logger reflects later changes to the std logger:
+
+    >>> logging.getLogger("lgcn-direct").setLevel(logging.ERROR)
+    >>> assert get_direct_all_level_logger(logging.getLogger("lgcn-direct")).level == logging.ERROR
+
     :param logger: python std logger.
     :return: logician configured logger.
     """
-    return DirectAllLevelLogger(_DALImpl(logger))
+    direct_logger = _direct_all_level_loggers.get(logger)
+    if direct_logger is None:
+        # concurrent first calls may each build one, that is harmless as both delegate to the same std logger.
+        direct_logger = DirectAllLevelLogger(_DALImpl(logger))
+        _direct_all_level_loggers[logger] = direct_logger
+    return direct_logger
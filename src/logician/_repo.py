@@ -10,14 +10,19 @@ import configparser
 import json
 import os
 import tempfile
+import threading
 import tomllib
 from abc import abstractmethod
-from collections import defaultdict
 from pathlib import Path
 from typing import Protocol, Any, override
 
 from logician.constants import LGCN_INFO_FP_ENV_VAR
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 class Persister[DS](Protocol):
     """
@@ -96,10 +101,14 @@ class EnvFilePathProvider(FilePathProvider):
 
 class IniFilePathProvider(FilePathProvider):
     def __init__(
-        self, path_provider: FilePathProvider, ini_file_path: Path = Path.cwd()
+        self, path_provider: FilePathProvider, ini_file_path: Path | None = None
     ):
+        """
+        :param path_provider: provides the path if ``ittusa.ini`` does not.
+        :param ini_file_path: directory of the ``ittusa.ini`` file. Defaults to the cwd at construction.
+        """
         super().__init__(path_provider)
-        self.ini_file_path = Path(ini_file_path, "ittusa.ini")
+        self.ini_file_path = Path(ini_file_path or Path.cwd(), "ittusa.ini")
         self.parser = configparser.ConfigParser()
 
     @override
@@ -115,10 +124,16 @@ class PyprojectFilePathProvider(FilePathProvider):
     def __init__(
         self,
         path_provider: FilePathProvider,
-        pyproject_root_file_path: Path = Path.cwd(),
+        pyproject_root_file_path: Path | None = None,
     ):
+        """
+        :param path_provider: provides the path if ``pyproject.toml`` does not.
+        :param pyproject_root_file_path: directory of the ``pyproject.toml`` file. Defaults to the cwd at construction.
+        """
         super().__init__(path_provider)
-        self.pyproject_file_path = Path(pyproject_root_file_path, "pyproject.toml")
+        self.pyproject_file_path = Path(
+            pyproject_root_file_path or Path.cwd(), "pyproject.toml"
+        )
 
     @override
     def _get_file_path(self) -> Path | None:
@@ -134,12 +149,16 @@ class PyprojectFilePathProvider(FilePathProvider):
 
 
 class ConstTmpDirFPP(FilePathProvider):
-    def __init__(
-        self, file_path: Path = Path(tempfile.gettempdir(), ".0-LGCN-LOG-DETAILS.json")
-    ):
+    def __init__(self, file_path: Path | None = None):
+        """
+        :param file_path: the path to provide. Defaults to ``.0-LGCN-LOG-DETAILS.json`` in the tmp dir, resolved at
+            construction rather than at import.
+        """
         # Type ignoring arg of super().__init__() as FilePathProvider is required but None is provided
         super().__init__(None)  # type: ignore[arg-type]
-        self.file_path = file_path
+        self.file_path = file_path or Path(
+            tempfile.gettempdir(), ".0-LGCN-LOG-DETAILS.json"
+        )
 
     @override
     def get_path(self) -> Path:
@@ -155,18 +174,32 @@ class FilePersister[DS](Persister, abc.ABC):
         self.file_path: Path = path_provider.get_path()
 
     def init(self):
-        if not self.file_path.exists():
-            self.file_path.write_text("")  # create the file
+        # create the file if missing, like touch. No truncation and no text layer, unlike write_text("").
+        os.close(os.open(self.file_path, os.O_CREAT | os.O_WRONLY, 0o666))
 
 
 class JSONFilePersister(FilePersister[dict]):
+    """
+    Persists the ``dict`` payload as JSON. Uses ``orjson`` when it is installed, else falls back to the std ``json``.
+    Both produce the same wire format. Non-``str`` keys are coerced to ``str`` by both, as ``json`` does.
+    """
+
     def commit(self, ds: dict):
-        with open(self.file_path, mode="w+") as fp:
+        if orjson is not None:
+            self.file_path.write_bytes(orjson.dumps(ds, option=orjson.OPT_NON_STR_KEYS))
+            return
+        with open(self.file_path, mode="w", encoding="utf-8") as fp:
             json.dump(ds, fp)
 
     def reload(self) -> dict:
+        data = self.file_path.read_bytes()
+        if not data:  # freshly initialised, empty repo file
+            return {}
         try:
-            return json.loads(self.file_path.read_text())
+            if orjson is not None:
+                return orjson.loads(data)
+            return json.loads(data)
+        # orjson.JSONDecodeError subclasses json.decoder.JSONDecodeError too
         except json.decoder.JSONDecodeError:
             return {}
 
@@ -213,7 +246,8 @@ class Repo(Protocol):
         Is an idempotent operation and does not contact the persister.
 
         :param id_: object id for which properties are to be queried from memory.
-        :return: property-name -> property-value dictionary for the properties stored in-memory for object id ``id_``.
+        :return: a copy of the property-name -> property-value dictionary for the properties stored in-memory for
+            object id ``id_``.
         """
         ...
 
@@ -225,8 +259,8 @@ class Repo(Protocol):
 
         Is an idempotent operation and does not contact the persister.
 
-        :return: object-id -> {property-name -> property-value} dictionary for the properties stored in-memory for
-            all object id(s).
+        :return: a copy of the object-id -> {property-name -> property-value} dictionary for the properties stored
+            in-memory for all object id(s). Changing it, at any depth, does not change the memory.
         """
         ...
 
@@ -246,56 +280,83 @@ class Repo(Protocol):
         """
         ...
 
+    @abstractmethod
+    def clear(self):
+        """
+        Forget all the in-memory (or indexed) properties without contacting the persister.
+        """
+        ...
+
 
 class DictRepo(Repo):
     def __init__(self, persister: Persister[dict]):
         """
-        Repo implementation using a ``defaultdict``.
+        Repo implementation using a ``dict``.
         """
-        self.repo: dict[str, dict[str, Any]] = defaultdict(dict)
+        self.repo: dict[str, dict[str, Any]] = dict()
         self.persister = persister
+        self._initialised = False
 
     @override
     def init(self):
-        if self.repo is None:
-            self.repo = defaultdict(dict)
-        self.persister.init()
+        # every logger-configurator inits the repo, only the first init needs to reach the persister.
+        if not self._initialised:
+            self.persister.init()
+            self._initialised = True
 
     @override
     def index(self, id_: str, **attrs):
-        self.repo[id_].update(attrs)
+        self.repo.setdefault(id_, {}).update(attrs)
 
     @override
     def read(self, id_: str) -> dict[str, Any]:
-        return self.repo[id_].copy()
+        return self.repo.get(id_, {}).copy()
 
+    @override
     def read_all(self) -> dict[str, dict[str, Any]]:
-        return self.repo.copy()
+        return {id_: props.copy() for id_, props in self.repo.items()}
 
     @override
     def commit(self):
         self.persister.commit(self.repo)
 
+    @override
+    def clear(self):
+        self.repo.clear()
+
     @override
     def reload(self):
-        self.repo = self.persister.reload()
+        # refresh in place, the repo dict is never rebound.
+        self.clear()
+        self.repo.update(self.persister.reload())
 
 
-__the_instance: Repo = DictRepo(
-    JSONFilePersister(
-        EnvFilePathProvider(
-            LGCN_INFO_FP_ENV_VAR,
-            EnvFilePathProvider(
-                "ITTU_FP",
-                IniFilePathProvider(PyprojectFilePathProvider(ConstTmpDirFPP())),
-            ),
-        )
-    )
-)
+__the_instance: Repo | None = None
+__the_instance_lock = threading.Lock()
 
 
 def get_repo() -> Repo:
     """
+    The repo is built lazily, on first call, so that importing ``logician`` does not resolve the repo file path.
+
     :return: a singleton repo implementation.
     """
+    global __the_instance
+    if __the_instance is None:
+        with __the_instance_lock:
+            # another thread may have built it while this one waited on the lock.
+            if __the_instance is None:
+                __the_instance = DictRepo(
+                    JSONFilePersister(
+                        EnvFilePathProvider(
+                            LGCN_INFO_FP_ENV_VAR,
+                            EnvFilePathProvider(
+                                "ITTU_FP",
+                                IniFilePathProvider(
+                                    PyprojectFilePathProvider(ConstTmpDirFPP())
+                                ),
+                            ),
+                        )
+                    )
+                )
     return __the_instance
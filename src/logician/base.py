@@ -16,6 +16,8 @@ class LogLogProtocol[L](Protocol):
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def log(self, level: L, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -25,6 +27,8 @@ class TraceLogProtocol(Protocol):
     Protocol supporting the trace method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def trace(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -34,6 +38,8 @@ class DebugLogProtocol(Protocol):
     Protocol supporting the debug method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def debug(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -43,6 +49,8 @@ class InfoLogProtocol(Protocol):
     Protocol supporting the info method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def info(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -52,6 +60,8 @@ class SuccessLogProtocol(Protocol):
     Protocol supporting the success method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def success(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -61,6 +71,8 @@ class NoticeLogProtocol(Protocol):
     Protocol supporting the notice method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def notice(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -70,6 +82,8 @@ class CommandLogProtocol(Protocol):
     Protocol supporting the command logging. This can be used to log a command's stderr into the logger itself.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def cmd(self, msg, *args, cmd_name: str | None = None, **kwargs) -> None:
         """
@@ -87,6 +101,8 @@ class WarningLogProtocol(Protocol):
     Protocol supporting the warning method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def warning(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -96,6 +112,8 @@ class ErrorLogProtocol(Protocol):
     Protocol supporting the error method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def error(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -105,6 +123,8 @@ class ExceptionLogProtocol(Protocol):
     Protocol supporting the exception method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def exception(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -114,6 +134,8 @@ class CriticalLogProtocol(Protocol):
     Protocol supporting the critical method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def critical(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -123,6 +145,8 @@ class FatalLogProtocol(Protocol):
     Protocol supporting the critical method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def fatal(self, msg, *args, **kwargs) -> None: ...  # pragma: no cover
 
@@ -159,7 +183,7 @@ class _MinLogProtocol[L](
         - CRITICAL
     """
 
-    pass
+    __slots__ = ()
 
 
 class MinLogProtocol[L](_MinLogProtocol[L], Protocol):
@@ -175,7 +199,7 @@ class MinLogProtocol[L](_MinLogProtocol[L], Protocol):
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
-    pass
+    __slots__ = ()
 
 
 class AllLogProtocol[L](
@@ -209,7 +233,7 @@ class AllLogProtocol[L](
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
-    pass
+    __slots__ = ()
 
 
 class HasUnderlyingLogger[L](Protocol):
@@ -221,6 +245,8 @@ class HasUnderlyingLogger[L](Protocol):
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def underlying_logger(self) -> MinLogProtocol[L]:
@@ -239,6 +265,8 @@ class SupportsTraceback(Protocol):
     Can process (in most cases, log) the exception tracebacks.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def traceback_enabled(self) -> bool:
@@ -274,4 +302,4 @@ class AllLevelLogger[L](
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
-    pass
+    __slots__ = ()
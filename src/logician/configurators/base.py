@@ -18,6 +18,8 @@ class LoggerConfigurator(Protocol):
     Stores configuration information to configure the std python logger.
     """
 
+    __slots__ = ()
+
     # TODO: make this accept logger param based on a type param from LoggerConfigurator. This will make
     #  LoggerConfigurator configure different types of loggers with the same interface.
     #  The decision to directly accept a python std logger instead of a type param was made to simplify and fast-pace
@@ -48,6 +50,8 @@ class HasUnderlyingConfigurator(Protocol):
     functionalities to them.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def underlying_configurator(self) -> LoggerConfigurator:
@@ -64,6 +68,8 @@ class LevelTarget[L](Protocol):
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def level(self) -> L:
@@ -90,4 +96,4 @@ class LevelLoggerConfigurator[L](LevelTarget[L], LoggerConfigurator, Protocol):
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
-    pass
+    __slots__ = ()
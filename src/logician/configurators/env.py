@@ -8,25 +8,24 @@ Logger configurators that configure log levels using environment variables.
 
 import logging
 import os
+from collections.abc import Sequence
 from typing import override, cast
 
 from logician import DirectStdAllLevelLogger
 from logician._repo import get_repo
 from logician.constants import LGCN_ALL_LOG_ENV_VAR
 from logician.configurators import LevelLoggerConfigurator
-from logician.configurators.list_lc import ListLoggerConfigurator
+from logician.configurators.list_lc import ListLoggerConfigurator, first_non_none
 
 
 class EnvListLC[T](ListLoggerConfigurator[T]):
-    DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE = ListLoggerConfigurator[
-        T
-    ].DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE
+    __slots__ = ("_env_list",)
 
     def __init__(
         self,
-        env_list: list[str],
+        env_list: Sequence[str],
         configurator: LevelLoggerConfigurator[T],
-        level_pickup_strategy=DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE,
+        level_pickup_strategy=first_non_none,
     ):
         """
         Environment variable list logger configurator.
@@ -36,23 +35,27 @@ class EnvListLC[T](ListLoggerConfigurator[T]):
         multiple environment variables and hence has a precedence order to the values form environment variables. The
         first environment variable value takes highest precedence and then the precedence diminishes.
 
-        :param env_list: list of environment variables. Default behavior is to take precedence in decreasing order.
+        :param env_list: sequence of environment variables. Default behavior is to take precedence in decreasing order.
         :param configurator: underlying logger configurator.
         :param level_pickup_strategy: strategy to pick-up level from a supplied list of levels. Default is to pick up
             the first supplied, then next and then so on.
         """
         super().__init__([], configurator, level_pickup_strategy)
-        self._env_list = env_list
+        self._env_list: tuple[str, ...] = tuple(env_list)
         get_repo().init()
 
     @property
     def env_list(self) -> list[str]:
-        return self._env_list
+        """
+        :return: a new list of the environment variables registered with this configurator.
+        """
+        return list(self._env_list)
 
     @override
     @property
-    def level_list(self) -> list[T | None]:
-        return [cast(T | None, os.getenv(e)) for e in self.env_list]
+    def level_list(self) -> Sequence[T | None]:
+        getenv = os.environ.get
+        return tuple(cast(T | None, getenv(e)) for e in self._env_list)
 
     @override
     def configure(self, logger: logging.Logger) -> DirectStdAllLevelLogger:
@@ -71,8 +74,8 @@ class EnvListLC[T](ListLoggerConfigurator[T]):
             to pick up the first non-``None`` level. ``DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE``.
         :return: a new ``EnvListLC``.
         """
-        env_list = overrides.pop("env_list", self.env_list.copy())
-        configurator = overrides.pop("configurator", self.underlying_configurator)
+        env_list = overrides.pop("env_list", self._env_list)
+        configurator = overrides.pop("configurator", self._underlying_configurator)
         level_pickup_strategy = overrides.pop(
             "level_pickup_strategy", self.level_pickup_strategy
         )
@@ -134,22 +137,20 @@ class EnvListLC[T](ListLoggerConfigurator[T]):
         :return: new logger configurator with extra newly introduced env vars.
         """
         if low_precedence:
-            _env_list = [*self.env_list, env, *envs]
+            _env_list = (*self._env_list, env, *envs)
         else:
-            _env_list = [env, *envs, *self.env_list]
+            _env_list = (env, *envs, *self._env_list)
         return self.clone(env_list=_env_list)
 
 
 class LgcnEnvListLC[T](EnvListLC[T]):
-    DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE = EnvListLC[
-        T
-    ].DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE
+    __slots__ = ("all_log_env_var",)
 
     def __init__(
         self,
-        env_list: list[str],
+        env_list: Sequence[str],
         configurator: LevelLoggerConfigurator[T],
-        level_pickup_strategy=DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE,
+        level_pickup_strategy=first_non_none,
         all_log_env_var: str = LGCN_ALL_LOG_ENV_VAR,
     ):
         """
@@ -162,14 +163,38 @@ class LgcnEnvListLC[T](EnvListLC[T]):
         variable ``LGCN_ALL_LOG`` is always appended to ``env_list`` so that if no environment variable is registered
         then at least this one is registered.
 
-        :param env_list: list of environment variables. Default behavior is to take precedence in decreasing order.
+        Examples:
+
+        * ``LGCN_ALL_LOG`` is registered last, without mutating the caller's list:
+
+        >>> envs = ['ENV_PPP']
+        >>> lc = LgcnEnvListLC(envs,
+        ...     None) # noqa: as configurator is unused and passed as None
+        >>> lc.env_list
+        ['ENV_PPP', 'LGCN_ALL_LOG']
+        >>> envs
+        ['ENV_PPP']
+
+        * ``LGCN_ALL_LOG`` is registered only once, however many times the configurator is cloned:
+
+        >>> lc.clone().clone().env_list
+        ['ENV_PPP', 'LGCN_ALL_LOG']
+        >>> lc.clone_with_envs('ENV_PPP.SOM', low_precedence=True).env_list
+        ['ENV_PPP', 'ENV_PPP.SOM', 'LGCN_ALL_LOG']
+
+        :param env_list: sequence of environment variables. Default behavior is to take precedence in decreasing order.
         :param configurator: underlying logger configurator.
         :param level_pickup_strategy: strategy to pick-up level from a supplied list of levels. Default is to pick up
             the first supplied, then next and then so on.
         :param all_log_env_var: Environment variable which, by default, will be checked last to get the logging levels.
         """
-        env_list.append(all_log_env_var)
-        super().__init__(env_list, configurator, level_pickup_strategy)
+        # dict.fromkeys() de-duplicates while retaining the precedence order of the env vars.
+        env_dict = dict.fromkeys(env_list)
+        env_dict.pop(all_log_env_var, None)
+        super().__init__(
+            (*env_dict, all_log_env_var), configurator, level_pickup_strategy
+        )
+        self.all_log_env_var = all_log_env_var
 
     @override
     def clone(self, **overrides) -> "LgcnEnvListLC[T]":
@@ -181,11 +206,17 @@ class LgcnEnvListLC[T](EnvListLC[T]):
 
             ``level_pickup_strategy`` - pick up a level from the list of levels supplied in ``level_list``. Default is
             to pick up the first non-``None`` level. ``DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE``.
+
+            ``all_log_env_var`` - Environment variable which, by default, will be checked last to get the logging
+            levels.
         :return: a new ``LgcnEnvListLC``.
         """
-        level_list = overrides.pop("env_list", self.env_list.copy())
-        configurator = overrides.pop("configurator", self.underlying_configurator)
+        env_list = overrides.pop("env_list", self._env_list)
+        configurator = overrides.pop("configurator", self._underlying_configurator)
         level_pickup_strategy = overrides.pop(
             "level_pickup_strategy", self.level_pickup_strategy
         )
-        return LgcnEnvListLC[T](level_list, configurator, level_pickup_strategy)
+        all_log_env_var = overrides.pop("all_log_env_var", self.all_log_env_var)
+        return LgcnEnvListLC[T](
+            env_list, configurator, level_pickup_strategy, all_log_env_var
+        )
@@ -9,6 +9,7 @@ First non-None level in this supplied list is picked up by default.
 """
 
 import logging
+from collections.abc import Iterable, Sequence
 from typing import override
 
 from logician import DirectStdAllLevelLogger
@@ -18,15 +19,38 @@ from logician.configurators import (
     HasUnderlyingConfigurator,
     LevelLoggerConfigurator,
 )
-from vt.utils.commons.commons.collections import get_first_non_none
+
+
+def first_non_none[T](lst: Iterable[T | None], default: T | None = None) -> T | None:
+    """
+    Get first non-``None`` item from ``lst`` else ``default``.
+
+    Same as ``vt.utils.commons.commons.collections.get_first_non_none()`` but scans in a single C-level ``next()``
+    call, rather than a python predicate call per item, as it runs on every logger configuration.
+
+    Examples:
+
+    >>> first_non_none([None, None, 2, None, 5], 9)
+    2
+    >>> first_non_none([None, None, None], 5)
+    5
+    >>> first_non_none([]) # None returned as default is None
+
+    :param lst: values to scan.
+    :param default: value to return if ``lst`` consists of all ``None``s.
+    :return: first non ``None`` value or ``default`` if all ``None`` are encountered.
+    """
+    return next((item for item in lst if item is not None), default)
 
 
 class ListLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurator):
-    DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE = get_first_non_none
+    DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE = first_non_none
+
+    __slots__ = ("_level_list", "_underlying_configurator", "level_pickup_strategy")
 
     def __init__(
         self,
-        level_list: list[T | None],
+        level_list: Sequence[T | None],
         configurator: LevelLoggerConfigurator[T],
         level_pickup_strategy=DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE,
     ):
@@ -42,26 +66,55 @@ class ListLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurator):
             Traceback (most recent call last):
             ValueError: Level list must not be None.
 
-        :param level_list: list of log levels which may contain ``None``. First non-``None`` value
-            is picked-up by default for logger configuration.
+        :param level_list: sequence of log levels which may contain ``None``. First non-``None`` value
+            is picked-up by default for logger configuration. Kept as an immutable tuple so that clones can share it.
         :param configurator: configurator which is decorated by this logger-configurator.
         :param level_pickup_strategy: pick up a level from the list of levels supplied in ``level_list``. Default is
             to pick up the first non-``None`` level. ``DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE``.
         """
         if level_list is None:
             raise ValueError("Level list must not be None.")
-        self._level_list = level_list
+        self._level_list: tuple[T | None, ...] = tuple(level_list)
         self._underlying_configurator = configurator
         self.level_pickup_strategy = level_pickup_strategy
         get_repo().init()
 
     def configure(self, logger: logging.Logger) -> DirectStdAllLevelLogger:
-        final_level = self.level_pickup_strategy(
-            self.level_list, self.underlying_configurator.level
-        )
-        self.underlying_configurator.set_level(final_level)
-        get_repo().index(logger.name, level_list=self.level_list, level=final_level)
-        return self.underlying_configurator.configure(logger)
+        """
+        >>> from logician.stdlog.configurator import StdLoggerConfigurator
+        >>> from logician.stdlog import NOTICE_LOG_LEVEL
+
+        Examples:
+
+          * First non-``None`` level from the list: ``INFO`` level
+
+            >>> _lgr = logging.getLogger("list-logger-demo-1")
+            >>> lc = ListLoggerConfigurator([None, logging.INFO, logging.DEBUG], StdLoggerConfigurator())
+            >>> lgr = lc.configure(_lgr)
+            >>> assert lgr.underlying_logger.level == logging.INFO
+
+          * Pickup strategy yields ``None`` hence, the underlying configurator's level is kept: ``NOTICE`` level
+
+            >>> _lgr = logging.getLogger("list-logger-demo-2")
+            >>> lc = ListLoggerConfigurator([logging.INFO], StdLoggerConfigurator(level=NOTICE_LOG_LEVEL),
+            ...     level_pickup_strategy=lambda levels, default: None)
+            >>> lgr = lc.configure(_lgr)
+            >>> assert lgr.underlying_logger.level == NOTICE_LOG_LEVEL
+            >>> assert lc.underlying_configurator.level == NOTICE_LOG_LEVEL
+
+        :param logger: the logger to configure.
+        :return: configured logger with its logging level picked up from the ``level_list``.
+        """
+        configurator = self._underlying_configurator
+        # read once as subclasses, e.g. EnvListLC, may compute level_list on every access.
+        level_list = self.level_list
+        final_level = self.level_pickup_strategy(level_list, configurator.level)
+        if final_level is not None:
+            configurator.set_level(final_level)
+        else:
+            final_level = configurator.level
+        get_repo().index(logger.name, level_list=level_list, level=final_level)
+        return configurator.configure(logger)
 
     @override
     @property
@@ -69,14 +122,14 @@ class ListLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurator):
         return self._underlying_configurator
 
     @property
-    def level_list(self) -> list[T | None]:
+    def level_list(self) -> Sequence[T | None]:
         return self._level_list
 
     @override
     def clone(self, **overrides) -> "ListLoggerConfigurator[T]":
         """
         overrides:
-            ``level_list`` - list of log levels which may contain ``None``. First non-``None`` value is picked-up by
+            ``level_list`` - sequence of log levels which may contain ``None``. First non-``None`` value is picked-up by
             default for logger configuration.
 
             ``configurator`` - configurator which is decorated by this logger-configurator.
@@ -85,8 +138,8 @@ class ListLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurator):
             Default is to pick up the first non-``None`` level. ``DEFAULT_LEVEL_PICKUP_FIRST_NON_NONE``.
         :return: a new ``ListLoggerConfigurator``.
         """
-        level_list = overrides.pop("level_list", self.level_list.copy())
-        configurator = overrides.pop("configurator", self.underlying_configurator)
+        level_list = overrides.pop("level_list", self._level_list)
+        configurator = overrides.pop("configurator", self._underlying_configurator)
         level_pickup_strategy = overrides.pop(
             "level_pickup_strategy", self.level_pickup_strategy
         )
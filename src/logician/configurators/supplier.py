@@ -6,6 +6,7 @@
 Configure loggers as per level supplied by a supplier.
 """
 
+import itertools
 import logging
 from typing import Callable, override
 
@@ -19,6 +20,8 @@ from logician.configurators import (
 
 
 class SupplierLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurator):
+    __slots__ = ("_underlying_configurator", "level_supplier")
+
     def __init__(
         self,
         level_supplier: Callable[[], T | None],
@@ -46,6 +49,31 @@ class SupplierLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurato
         self._underlying_configurator = configurator
         get_repo().init()
 
+    @classmethod
+    def from_constant(
+        cls, level: T | None, configurator: LevelLoggerConfigurator[T]
+    ) -> "SupplierLoggerConfigurator[T]":
+        """
+        Configurator that always supplies the same ``level``.
+
+        Prefer this over a ``lambda: level`` supplier as the level is supplied by a C-level callable, without a python
+        function call on every ``configure()``.
+
+        Examples:
+
+        >>> from logician.stdlog.configurator import StdLoggerConfigurator
+
+        >>> lc = SupplierLoggerConfigurator.from_constant(logging.INFO, StdLoggerConfigurator())
+        >>> assert lc.level_supplier() == logging.INFO
+        >>> lgr = lc.configure(logging.getLogger("supplier-logger-const-demo"))
+        >>> assert lgr.underlying_logger.level == logging.INFO
+
+        :param level: level to supply. ``None`` lets the underlying configurator decide the level.
+        :param configurator: underlying configurator.
+        :return: a new ``SupplierLoggerConfigurator`` always supplying ``level``.
+        """
+        return cls(itertools.repeat(level).__next__, configurator)
+
     def configure(self, logger: logging.Logger) -> DirectStdAllLevelLogger:
         """
         >>> from logician.stdlog.configurator import StdLoggerConfigurator
@@ -72,15 +100,14 @@ class SupplierLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurato
         :param logger: the logger to configure.
         :return: configured logger with its logging level set by the ``level_supplier``.
         """
-        computed_level = self.level_supplier()
-        final_level = (
-            computed_level
-            if computed_level is not None
-            else self.underlying_configurator.level
-        )
-        self.underlying_configurator.set_level(final_level)
+        configurator = self._underlying_configurator
+        final_level = self.level_supplier()
+        if final_level is not None:
+            configurator.set_level(final_level)
+        else:
+            final_level = configurator.level
         get_repo().index(logger.name, level=final_level)
-        return self.underlying_configurator.configure(logger)
+        return configurator.configure(logger)
 
     @override
     @property
@@ -127,5 +154,5 @@ class SupplierLoggerConfigurator[T](LoggerConfigurator, HasUnderlyingConfigurato
         :return: a new ``SupplierLoggerConfigurator``.
         """
         level_supplier = overrides.pop("level_supplier", self.level_supplier)
-        configurator = overrides.pop("configurator", self.underlying_configurator)
+        configurator = overrides.pop("configurator", self._underlying_configurator)
         return SupplierLoggerConfigurator(level_supplier, configurator)
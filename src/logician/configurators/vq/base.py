@@ -7,6 +7,7 @@ Base interfaces for verbosity (V) and quietness (Q) configurators.
 """
 
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol, Literal, Any, override, overload
 
 from vt.utils.errors.error_specs import DefaultOrError, WarningWithDefault
@@ -23,6 +24,8 @@ class VQConfigurator[T](Protocol):
     Configurator for verbosity and quietness configurations.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def vq_level_map(self) -> VQ_DICT_LITERAL[T]:
@@ -37,12 +40,14 @@ class VQLevelOrDefault[T](VQConfigurator[T], Protocol):
     Interface to facilitate getting a logging level from VQConfigurator.
     """
 
+    __slots__ = ()
+
     def level_or_default(
         self,
         ver_qui: V_LITERAL | Q_LITERAL | None,
         emphasis: Literal["verbosity", "quietness", "verbosity or quietness"],
         default_level: T,
-        choices: list[Any],
+        choices: Sequence[Any],
     ) -> T:
         """
         :param ver_qui: verbosity or quietness.
@@ -57,8 +62,9 @@ class VQLevelOrDefault[T](VQConfigurator[T], Protocol):
             try:
                 return self.vq_level_map[ver_qui]
             except KeyError as e:
+                # copied only on this error path, as the handler takes a list.
                 return self.key_error_handler.handle_key_error(
-                    e, default_level, emphasis, choices
+                    e, default_level, emphasis, list(choices)
                 )
         else:
             return default_level
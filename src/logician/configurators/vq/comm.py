@@ -74,12 +74,14 @@ class VQCommon[T](VQCommConfigurator[T]):
 
             - supplied verbosity or quietness is not within the ``vq_level_map``.
 
-        :param vq_level_map: A dictionary containing verbosity|quietness -> logging.level mapping.
+        :param vq_level_map: A dictionary containing verbosity|quietness -> logging.level mapping. Not to be
+            mutated once supplied.
         :param warn_only: Only warn on potential errors instead of raising an Error.
         :param level_or_default_handler: Level computer. Defaults to ``SimpleWarningVQLevelOrDefault`` if ``None`` or
             not supplied.
         """
         self._vq_level_map = vq_level_map
+        self._choices = tuple(vq_level_map)
         if level_or_default_handler:
             self.level_or_default_handler = level_or_default_handler
         else:
@@ -167,7 +169,7 @@ class VQCommon[T](VQCommConfigurator[T]):
                 ver_qui,
                 "verbosity or quietness",
                 default_level,
-                list(self.vq_level_map.keys()),
+                self._choices,
             )
         else:
             level = default_level
@@ -6,6 +6,7 @@
 Constants for verbosity (V) and quietness (Q) configurators.
 """
 
+from collections.abc import Mapping
 from typing import Literal
 
 V_LITERAL = Literal["v", "vv", "vvv"]
@@ -18,9 +19,9 @@ Q_LITERAL = Literal["q", "qq", "qqq"]
 Quietness literal. Progressively denotes more and more quietness.
 """
 
-type VQ_DICT_LITERAL[T] = dict[V_LITERAL | Q_LITERAL, T]
+type VQ_DICT_LITERAL[T] = Mapping[V_LITERAL | Q_LITERAL, T]
 """
-Literal denoting how should a {``verbosity-quietness -> logging-level``} dict be structured.
+Literal denoting how should a {``verbosity-quietness -> logging-level``} mapping be structured.
 
 :param T: type of the logger level, for e.g. logger level type is [int | str] for python std logging lib.
 """
@@ -74,10 +74,12 @@ class VQSepExclusive[T](VQSepConfigurator[T]):
             - verbosity and quietness are provided together.
             - supplied verbosity or quietness is not within the ``vq_level_map``.
 
-        :param vq_level_map: A dictionary containing verbosity|quietness -> logging.level mapping.
+        :param vq_level_map: A dictionary containing verbosity|quietness -> logging.level mapping. Not to be
+            mutated once supplied.
         :param warn_only: Only warn on potential errors instead of raising an Error.
         """
         self._vq_level_map = vq_level_map
+        self._choices = tuple(vq_level_map)
         self.warn_only = warn_only
         if level_or_default_handler:
             self.level_or_default_handler = level_or_default_handler
@@ -218,14 +220,14 @@ class VQSepExclusive[T](VQSepConfigurator[T]):
                     verbosity,
                     "verbosity",
                     default_level,
-                    list(self.vq_level_map.keys()),
+                    self._choices,
                 )
             elif quietness:
                 level = self.level_or_default_handler.level_or_default(
                     quietness,
                     "quietness",
                     default_level,
-                    list(self.vq_level_map.keys()),
+                    self._choices,
                 )
             else:
                 level = default_level
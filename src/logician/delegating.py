@@ -26,7 +26,7 @@ class ProtocolMinLevelLoggerImplBase[L](_MinLogProtocol[L], Protocol):
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
-    pass
+    __slots__ = ()
 
 
 class ProtocolMinLevelLoggerImplABC[L](
@@ -44,7 +44,7 @@ class ProtocolMinLevelLoggerImplABC[L](
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
-    pass
+    __slots__ = ()
 
 
 class AllLevelLoggerImplABC[L](
@@ -71,7 +71,7 @@ class AllLevelLoggerImplABC[L](
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
-    pass
+    __slots__ = ()
 
 
 class DelegatingLogger[L](Protocol):
@@ -81,6 +81,8 @@ class DelegatingLogger[L](Protocol):
     L - Level type, for e.g. ``int`` for python std logging.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def logger_impl(self) -> ProtocolMinLevelLoggerImplBase[L]:
@@ -6,14 +6,12 @@ Extract and showcase details about a program's logger configurators.
 """
 
 import os
-import shlex
 import sys
 import argparse
-import subprocess
-import tempfile
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
+from collections.abc import Iterable, Mapping
 from logician.errors import (
     LogicianExitingException,
     LogicianCmdException,
@@ -21,8 +19,6 @@ from logician.errors import (
     LogicianException,
 )
 
-from vt.utils.commons.commons.strings import generate_random_string
-
 from vt.utils.errors.error_specs import ERR_INVALID_USAGE, ERR_CMD_NOT_FOUND
 
 from logician.constants import LGCN_MAIN_CMD_NAME, LGCN_INFO_FP_ENV_VAR
@@ -93,87 +89,298 @@ Use long listing format with env-vars:
 CONST_FMT = "{cmd}\t{name}\t{level}\t{vq-support}\t{env-support}"
 
 
-def main(*commands: str) -> dict[str, dict[str, dict[str, Any]]]:
+_CACHE_KEY_ENV_PREFIXES = ("LGCN_", "ITTU_")
+"""
+Env vars with these prefixes configure logician itself, hence are part of a command's cache key.
+"""
+
+_CACHE_KEY_ENV_VARS = ("PATH", "PYTHONPATH", "PYTHONHOME", "VIRTUAL_ENV")
+"""
+Env vars that decide which program and which libraries a command runs, hence are part of a command's cache key.
+"""
+
+_CACHE_KEY_CONFIG_FILES = ("ittusa.ini", "pyproject.toml")
+"""
+Config files, in the cwd, that logician reads the repo file location from, hence are part of a command's cache key.
+"""
+
+_CACHE_MAX_FILES = 128
+"""
+Number of commands whose details are kept cached. Least recently used ones are evicted beyond this.
+"""
+
+_CACHE_STALE_REPO_FILE_SECS = 24 * 60 * 60
+"""
+Repo files in the cache dir older than this are left behind by crashed runs, rather than being used by running ones.
+"""
+
+
+def _file_sig(path: Path) -> tuple[str, int, int] | None:
     """
-    Assumes that each command supports -h option.
+    :param path: file to get the signature for.
+    :return: resolved path, mtime and size of the ``path`` file. ``None`` if ``path`` is not an existing file.
+    """
+    try:
+        path = path.resolve()
+        stat = path.stat()
+    except (OSError, RuntimeError):
+        return None
+    if not path.is_file():
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
 
-    :param commands: commands to get the logger configurator details for.
-    :return: a dictionary of command and their individual logger-configurator properties.
-    :raises VTCmdException: if error in running ``<<supplied-command>> --help`` for each command.
+
+def _cache_fp(argv: list[str], env: Mapping[str, str]) -> Path | None:
     """
-    cmd_det_dict: dict[str, dict[str, dict[str, Any]]] = dict()  # pragma: no cover
-    env_fp: Path = Path(
-        tempfile.gettempdir(),
-        f".0-LGCN-{'-'.join(commands)}-{generate_random_string()}.json",
-    )
-    os.environ[LGCN_INFO_FP_ENV_VAR] = str(env_fp)
-    from logician._repo import get_repo
-
-    get_repo().init()
-    for command in commands:
-        env_fp.write_text("")  # quick and dirty way to reinitialise the repo files.
-        # This logic must somehow be handled into the repo provider itself.
-        # TODO: If the env_fp.write("") statement is removed then, the file present in the /tmp dir formed by env_fp
-        #  remains with the previous command's logger-configurator details. This is erroneous as then any command which
-        #  does not use logger-configurators actually gets the configurator details which are already stored in the
-        #  env_fp file from the previous command run.
-        #  To get a feel of what this error entails, run these two commands:
-        #  lgcn grep <a-command-that-uses-logician> # this will output grep: {}, i.e. grep has no logger-configurators
-        #  lgcn <a-command-that-uses-logician> grep # this will output grep: <details-of-logger-configurators-of-the-second-program>,
-        #  i.e. grep is incorrectly shown the logger configurator values of other programs as the env_fp file still
-        #  stores those details from the previous run.
-        #  FIX THIS!
-        try:
-            subprocess.run(
-                [*shlex.split(command), "--help"], capture_output=True, check=True
+    Path of the file that caches the logger-configurator details of ``command``.
+
+    The cache key covers:
+
+    - the command line.
+    - path, mtime and size of the resolved executable and of the files named on the command line, e.g. ``app.py`` in
+      ``python app.py``.
+    - the cwd and the logician config files in it.
+    - logician's own install, so that upgrades are picked up.
+    - env vars that configure logician or decide which program and libraries are run.
+
+    Env vars that the command's loggers read their levels from are checked against the cached details on reading
+    instead, see ``_read_cache()``.
+
+    :param argv: split command line of the command to get the cache file path for.
+    :param env: environment the command is run with, without ``LGCN_INFO_FP``.
+    :return: path of the cache file. ``None`` if the command's executable cannot be resolved or the cache directory
+        cannot be created.
+    """
+    import hashlib
+    import shutil
+
+    import logician
+
+    exe = shutil.which(argv[0], path=env.get("PATH"))
+    if exe is None:
+        return None
+    exe_sig = _file_sig(Path(exe))
+    if exe_sig is None:
+        return None
+    cwd = os.getcwd()
+    key = hashlib.blake2b(
+        repr(
+            (
+                argv,
+                exe_sig,
+                [_file_sig(Path(cwd, arg)) for arg in argv[1:]],
+                cwd,
+                [_file_sig(Path(cwd, cfg)) for cfg in _CACHE_KEY_CONFIG_FILES],
+                _file_sig(Path(logician.__file__)),
+                sorted(
+                    (name, value)
+                    for name, value in env.items()
+                    if name in _CACHE_KEY_ENV_VARS
+                    or name.startswith(_CACHE_KEY_ENV_PREFIXES)
+                ),
             )
-        except FileNotFoundError as f:
-            raise LogicianCmdNotFoundError(
-                command=shlex.split(command),
-                file_not_found_error=f,
-                exit_code=ERR_CMD_NOT_FOUND,
-            ) from f
-        except subprocess.CalledProcessError as e:
-            raise LogicianCmdException(
-                f"Command failed: {e.cmd}",
-                f"Stderr: {e.stderr}",
-                f"Stdout: {e.stdout}",
-                called_process_error=e,
-                exit_code=e.returncode,
-            ) from e
-        get_repo().reload()
-        cmd_det_dict[command] = get_repo().read_all()
-    return cmd_det_dict
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+    try:
+        # Path.home() raises RuntimeError if the home directory cannot be determined.
+        cache_dir = Path(
+            env.get("XDG_CACHE_HOME") or Path.home() / ".cache", LGCN_MAIN_CMD_NAME
+        )
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError):
+        return None
+    return Path(cache_dir, f"{key}.json")
 
 
-def cli(args: list[str]) -> argparse.Namespace:
+def _read_cache(
+    cache_fp: Path, env: Mapping[str, str]
+) -> dict[str, dict[str, Any]] | None:
     """
-    Examples:
+    :param cache_fp: cache file of the command.
+    :param env: environment the command is run with, without ``LGCN_INFO_FP``.
+    :return: the cached logger-configurator details of the command. ``None`` if not cached or if any env var that the
+        command's loggers read their levels from has changed since the details were cached.
+    """
+    from logician._repo import ConstTmpDirFPP, JSONFilePersister
 
-    >>> cli(["cmd1"])
-    Namespace(command=['cmd1'], ls=False, fmt=None, env_list=False)
+    try:
+        cached = JSONFilePersister(ConstTmpDirFPP(cache_fp)).reload()
+        if "info" not in cached or cached.get("env") != {
+            name: env.get(name) for name in cached.get("env", {})
+        }:
+            return None
+        # mark as recently used so that it is evicted last.
+        os.utime(cache_fp)
+    # not cached yet or evicted by a concurrent run.
+    except OSError:
+        return None
+    return cached["info"]
+
+
+def _evict_cache(cache_dir: Path):
+    """
+    Remove the least recently used cache files beyond ``_CACHE_MAX_FILES`` and the repo files left behind by crashed
+    runs.
 
-    >>> cli(["cmd1", "cmd2"])
-    Namespace(command=['cmd1', 'cmd2'], ls=False, fmt=None, env_list=False)
+    :param cache_dir: the directory holding the cache files.
+    """
+    import time
 
-    >>> cli(["cmd1", "cmd2", "-l"])
-    Namespace(command=['cmd1', 'cmd2'], ls=True, fmt=None, env_list=False)
+    sigs = []
+    stale_ns = time.time_ns() - _CACHE_STALE_REPO_FILE_SECS * 1_000_000_000
+    for fp in cache_dir.glob("*.json"):
+        try:
+            mtime_ns = fp.stat().st_mtime_ns
+        except OSError:
+            # already evicted by a concurrent run.
+            continue
+        # dot-files are the repo files of the commands being run, only evicted once stale.
+        if fp.name.startswith("."):
+            if mtime_ns < stale_ns:
+                fp.unlink(missing_ok=True)
+        else:
+            sigs.append((mtime_ns, fp))
+    sigs.sort(reverse=True)
+    for _, fp in sigs[_CACHE_MAX_FILES:]:
+        fp.unlink(missing_ok=True)
+
+
+def _run_one(
+    command: str, env: Mapping[str, str], use_cache: bool = False
+) -> dict[str, dict[str, Any]]:
+    """
+    Run ``<<command>> --help`` against its own repo file and read back the logger-configurator details that the
+    command indexed.
+
+    :param command: command to get the logger-configurator details for.
+    :param env: environment to run the command with, without ``LGCN_INFO_FP``.
+    :param use_cache: reuse the details cached by an earlier run of the unchanged command, if any, instead of running
+        it again. Cache the details otherwise.
+    :return: the command's logger-configurator properties.
+    :raises VTCmdException: if error in running ``<<command>> --help``.
+    """
+    # imported here, instead of the module top, to keep lgcn's startup cheap for runs that exit early, e.g. lgcn --help.
+    import shlex
+    import subprocess
+    import tempfile
 
-    >>> cli(["cmd1", "cmd2", "-le"])
-    Namespace(command=['cmd1', 'cmd2'], ls=True, fmt=None, env_list=True)
+    from logician._repo import ConstTmpDirFPP, DictRepo, JSONFilePersister
 
-    >>> cli([])
-    Traceback (most recent call last):
-    ...
-    SystemExit: 2
+    # split once, shlex.split() is a pure python parser.
+    argv = shlex.split(command)
+    if not argv:
+        errmsg = "Empty command supplied."
+        raise LogicianExitingException(
+            errmsg, exit_code=ERR_INVALID_USAGE
+        ) from ValueError(errmsg)
+    cache_fp = _cache_fp(argv, env) if use_cache else None
+    if cache_fp is not None:
+        cached_info = _read_cache(cache_fp, env)
+        if cached_info is not None:
+            return cached_info
+
+    # each command gets a fresh, empty repo file so that no details leak from one command's run into another's.
+    # Command names are not embedded in the file name to avoid path length limits and leaking them into the tmp dir.
+    # The file is made in the cache dir, when caching, so that it can be atomically moved in as the cache file.
+    fd, path = tempfile.mkstemp(
+        prefix=".0-LGCN-",
+        suffix=".json",
+        dir=cache_fp.parent if cache_fp is not None else None,
+    )
+    os.close(fd)
+    env_fp = Path(path)
+    persister = JSONFilePersister(ConstTmpDirFPP(env_fp))
+    repo = DictRepo(persister)
+    try:
+        # The --help output itself is discarded. stderr is only needed for error reporting, so it goes to an unnamed
+        # temp file, read back only on failure, rather than a pipe that buffers all of it in memory on every run.
+        # A SpooledTemporaryFile would not help as handing its fileno() to the child rolls it over to disk anyway.
+        with tempfile.TemporaryFile() as err_fp:
+            try:
+                # fds opened by python are non-inheritable (PEP 446), so there is nothing for close_fds to close on
+                # POSIX and skipping it saves walking the fd table on every spawn and allows the faster posix_spawn().
+                subprocess.run(
+                    [*argv, "--help"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=err_fp,
+                    check=True,
+                    close_fds=os.name != "posix",
+                    env={**env, LGCN_INFO_FP_ENV_VAR: str(env_fp)},
+                )
+            except FileNotFoundError as f:
+                raise LogicianCmdNotFoundError(
+                    command=argv,
+                    file_not_found_error=f,
+                    exit_code=ERR_CMD_NOT_FOUND,
+                ) from f
+            except subprocess.CalledProcessError as e:
+                err_fp.seek(0)
+                e.stderr = err_fp.read()
+                raise LogicianCmdException(
+                    f"Command failed: {e.cmd}",
+                    f"Stderr: {e.stderr}",
+                    called_process_error=e,
+                    exit_code=e.returncode,
+                ) from e
+        repo.reload()
+        info = repo.read_all()
+        if cache_fp is not None:
+            # record the env vars that the loggers read their levels from, so that the cache is dropped once they change.
+            level_envs = {
+                name
+                for details in info.values()
+                for name in details.get("env_list", ())
+            }
+            persister.commit(
+                {"env": {name: env.get(name) for name in level_envs}, "info": info}
+            )
+            os.replace(env_fp, cache_fp)
+            _evict_cache(cache_fp.parent)
+        return info
+    finally:
+        env_fp.unlink(missing_ok=True)
 
-    >>> cli(['cmd1', '--fmt'])
-    Traceback (most recent call last):
-    ...
-    SystemExit: 2
 
-    :param args: arguments to the ``lgcn`` CLI.
-    :return: Calculated ``argparse.Namespace`` from ``lgcn`` CLI.
+def main(
+    *commands: str, use_cache: bool = False
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Assumes that each command supports -h option.
+
+    The commands are run concurrently as each run is mostly spent waiting on the child process.
+
+    :param commands: commands to get the logger configurator details for.
+    :param use_cache: reuse the details cached by earlier runs of the unchanged commands instead of running them again.
+        Off by default as changes to the files a command imports, other than those named on its command line, are not
+        detected. See ``_cache_fp()`` for what is.
+    :return: a dictionary of command and their individual logger-configurator properties.
+    :raises VTCmdException: if error in running ``<<supplied-command>> --help`` for each command.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    unique_commands = list(dict.fromkeys(commands))
+    if not unique_commands:
+        return dict()
+    # snapshot the environment once, for all the commands, rather than re-reading os.environ per command. Each
+    # command's own repo file is passed on top of it so that os.environ itself is never mutated.
+    env = dict(os.environ)
+    env.pop(LGCN_INFO_FP_ENV_VAR, None)
+    max_workers = min(len(unique_commands), (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [
+            ex.submit(_run_one, command, env, use_cache) for command in unique_commands
+        ]
+        # collect in the supplied order so that the output order is deterministic.
+        return {
+            command: future.result()
+            for command, future in zip(unique_commands, futures)
+        }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    :return: a new parser for the ``lgcn`` CLI.
     """
     parser = argparse.ArgumentParser(
         LGCN_MAIN_CMD_NAME,
@@ -214,14 +421,61 @@ def cli(args: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Get supported environment variables list.",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the details cached by an earlier run of an unchanged command instead of running it again. "
+        "Changes to the files that a command imports, other than those named on its command line, are not detected.",
+        dest="use_cache",
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+"""
+Parser for the ``lgcn`` CLI, built once as it is the same for every ``cli()`` call.
+"""
+
 
+def cli(args: list[str]) -> argparse.Namespace:
+    """
+    Examples:
+
+    >>> cli(["cmd1"])
+    Namespace(command=['cmd1'], ls=False, fmt=None, env_list=False, use_cache=False)
+
+    >>> cli(["cmd1", "cmd2"])
+    Namespace(command=['cmd1', 'cmd2'], ls=False, fmt=None, env_list=False, use_cache=False)
+
+    >>> cli(["cmd1", "cmd2", "-l"])
+    Namespace(command=['cmd1', 'cmd2'], ls=True, fmt=None, env_list=False, use_cache=False)
+
+    >>> cli(["cmd1", "cmd2", "-le"])
+    Namespace(command=['cmd1', 'cmd2'], ls=True, fmt=None, env_list=True, use_cache=False)
+
+    >>> cli(["cmd1", "--cache"])
+    Namespace(command=['cmd1'], ls=False, fmt=None, env_list=False, use_cache=True)
+
+    >>> cli([])
+    Traceback (most recent call last):
+    ...
+    SystemExit: 2
+
+    >>> cli(['cmd1', '--fmt'])
+    Traceback (most recent call last):
+    ...
+    SystemExit: 2
+
+    :param args: arguments to the ``lgcn`` CLI.
+    :return: Calculated ``argparse.Namespace`` from ``lgcn`` CLI.
+    """
     if "--help" in args:
-        print(parser.format_help() + examples)
+        print(_PARSER.format_help() + examples)
         sys.exit()
 
-    namespace: argparse.Namespace = parser.parse_args(args)
+    namespace: argparse.Namespace = _PARSER.parse_args(args)
     if namespace.fmt and not namespace.ls:
-        parser.error("--format is only allowed with --list")
+        _PARSER.error("--format is only allowed with --list")
     return namespace
 
 
@@ -247,6 +501,12 @@ def main_view(
     ...
     logician.errors.LogicianExitingException: ValueError: fmt cannot be used when ls is Falsy.
 
+    >>> info = {"cmd-1": {"lgr": {"level": "DEBUG", "env_list": ["ENV", "LGCN_ALL_LOG"]}}, "cmd-2": {}}
+    >>> main_view(info, False, False)
+    cmd-1: ['lgr']
+    >>> main_view(info, False, True)
+    cmd-1: ['ENV', 'LGCN_ALL_LOG']
+
     :param info_dict: mappings of commands and their individual logger configurator details.
     :param ls: Use long listing format
     :param env_list: show supported env vars.
@@ -303,11 +563,11 @@ def main_view(
     if ls:
         # Only print list in the predetermined fmt
         frmt = "{:<30} |" * 5  # 5 columns
-        print(frmt.format("command", "logger", "level", "vq-support", "env-support"))
-        print(frmt.format(*(["-" * 30] * 5)))
-        for cmd, lgr in ls_det.items():
+        _print_lines(
             [
-                print(
+                frmt.format("command", "logger", "level", "vq-support", "env-support"),
+                frmt.format(*(["-" * 30] * 5)),
+                *(
                     frmt.format(
                         cmd,
                         _c,
@@ -315,14 +575,16 @@ def main_view(
                         str(_l["vq_support"]),
                         str(_l["env_support"]),
                     )
-                )
-                for _c, _l in lgr.items()
+                    for cmd, lgr in ls_det.items()
+                    for _c, _l in lgr.items()
+                ),
             ]
+        )
         return
 
     if env_list:
         # Only print env-list per command
-        [print(f"{_c}: {_l}") for _c, _l in el_det.items()]
+        _print_lines(f"{_c}: {_l}" for _c, _l in el_det.items())
         return
 
     # Simply print logger names per command
@@ -330,7 +592,20 @@ def main_view(
     for cmd in info_dict:
         for lgr in info_dict[cmd]:
             ln_det[cmd].append(lgr)
-    [print(f"{_c}: {_l}") for _c, _l in ln_det.items()]
+    _print_lines(f"{_c}: {_l}" for _c, _l in ln_det.items())
+
+
+def _print_lines(lines: Iterable[str]):
+    """
+    Print all the ``lines`` on ``stdout`` in a single write, rather than a ``print()`` call per line.
+
+    >>> _print_lines(["cmd-1: ['lgr']", "cmd-2: []"])
+    cmd-1: ['lgr']
+    cmd-2: []
+
+    :param lines: lines to print, without the trailing newlines.
+    """
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
 
 
 def main_cli(args: list[str] | None = None):
@@ -348,6 +623,7 @@ def main_cli(args: list[str] | None = None):
         namespace: argparse.Namespace = cli(args)
         info_dict: dict[str, dict[str, dict[str, Any]]] = main(
             *namespace.command,
+            use_cache=namespace.use_cache,
         )
         main_view(
             info_dict,
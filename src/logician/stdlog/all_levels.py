@@ -27,6 +27,8 @@ class StdProtocolAllLevelLogger(AllLevelLogger[L], DelegatingLogger[L], Protocol
     Interface for a std protocol logger which provides all logging levels by the protocol implementation.
     """
 
+    __slots__ = ()
+
     @override
     @property
     @abstractmethod
@@ -39,6 +41,8 @@ class StdProtocolAllLevelLogger(AllLevelLogger[L], DelegatingLogger[L], Protocol
 
 
 class BaseStdProtocolAllLevelLogger(StdProtocolAllLevelLogger, ABC):
+    __slots__ = ("__weakref__", "_logger_impl", "_underlying_logger")
+
     def __init__(self, logger_impl: StdProtocolAllLevelLoggerImpl):
         """
         Implementation for a std protocol logger which provides all logging levels by the protocol implementation.
@@ -47,11 +51,51 @@ class BaseStdProtocolAllLevelLogger(StdProtocolAllLevelLogger, ABC):
 
         :param logger_impl: the logger implementations where all logging calls will be forwarded to.
         """
+        # logging calls are forwarded to _logger_impl directly, not through the logger_impl property, as they run on
+        # every log call.
         self._logger_impl = logger_impl
         self._underlying_logger = self._logger_impl.underlying_logger
-        self.name = self._logger_impl.underlying_logger.name
-        self.level = self._logger_impl.underlying_logger.level
-        self.disabled = self._logger_impl.underlying_logger.disabled
+
+    @property
+    def name(self) -> S:
+        """
+        :return: name of the underlying logger.
+        """
+        return self._underlying_logger.name
+
+    @name.setter
+    def name(self, name: S) -> None:
+        self._underlying_logger.name = name
+
+    @property
+    def level(self) -> L:
+        """
+        :return: current level of the underlying logger, as this logger may outlive level changes to it.
+        """
+        return self._underlying_logger.level
+
+    @level.setter
+    def level(self, level: L) -> None:
+        """
+        Set the level of the underlying logger, through ``setLevel()`` for a std logger so that its level cache is
+        cleared.
+        """
+        underlying_logger = self._underlying_logger
+        if isinstance(underlying_logger, Logger):
+            underlying_logger.setLevel(level)
+        else:
+            underlying_logger.level = level
+
+    @property
+    def disabled(self) -> bool:
+        """
+        :return: whether the underlying logger is currently disabled.
+        """
+        return self._underlying_logger.disabled
+
+    @disabled.setter
+    def disabled(self, disabled: bool) -> None:
+        self._underlying_logger.disabled = disabled
 
     @override
     @property
@@ -66,27 +110,27 @@ class BaseStdProtocolAllLevelLogger(StdProtocolAllLevelLogger, ABC):
     @override
     @property
     def traceback_enabled(self) -> bool:
-        return self.logger_impl.traceback_enabled  # pragma: no cover
+        return self._logger_impl.traceback_enabled  # pragma: no cover
 
     @override
     def trace(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.trace(msg, *args, **kwargs)
+        self._logger_impl.trace(msg, *args, **kwargs)
 
     @override
     def debug(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.debug(msg, *args, **kwargs)
+        self._logger_impl.debug(msg, *args, **kwargs)
 
     @override
     def info(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.info(msg, *args, **kwargs)
+        self._logger_impl.info(msg, *args, **kwargs)
 
     @override
     def notice(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.notice(msg, *args, **kwargs)
+        self._logger_impl.notice(msg, *args, **kwargs)
 
     @override
     def success(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.success(msg, *args, **kwargs)
+        self._logger_impl.success(msg, *args, **kwargs)
 
     @override
     def cmd(self, msg, *args, cmd_name: str | None = None, **kwargs) -> None:
@@ -98,36 +142,38 @@ class BaseStdProtocolAllLevelLogger(StdProtocolAllLevelLogger, ABC):
             ``COMMAND`` is picked-up. But as this is a ``DelegatingLogger`` hence this behavior can be altered in the
             delegatee class.
         """
-        self.logger_impl.cmd(msg, *args, cmd_name=cmd_name, **kwargs)
+        self._logger_impl.cmd(msg, *args, cmd_name=cmd_name, **kwargs)
 
     @override
     def warning(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.warning(msg, *args, **kwargs)
+        self._logger_impl.warning(msg, *args, **kwargs)
 
     @override
     def error(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.error(msg, *args, **kwargs)
+        self._logger_impl.error(msg, *args, **kwargs)
 
     @override
     def critical(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.critical(msg, *args, **kwargs)
+        self._logger_impl.critical(msg, *args, **kwargs)
 
     @override
     def fatal(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.fatal(msg, *args, **kwargs)
+        self._logger_impl.fatal(msg, *args, **kwargs)
 
     @override
     def exception(self, msg, *args, **kwargs) -> None:
-        self.logger_impl.exception(msg, *args, **kwargs)
+        self._logger_impl.exception(msg, *args, **kwargs)
 
     @override
     def log(self, level: L, msg: str, *args, **kwargs) -> None:
-        self.logger_impl.log(level, msg, *args, **kwargs)
+        self._logger_impl.log(level, msg, *args, **kwargs)
 
 
 class BaseDirectStdAllLevelLogger(
     BaseStdProtocolAllLevelLogger, DirectStdAllLevelLogger, ABC
 ):
+    __slots__ = ("cmd_name", "level_name_map")
+
     def __init__(
         self,
         logger_impl: BaseDirectStdAllLevelLoggerImpl,
@@ -180,10 +226,12 @@ class BaseDirectStdAllLevelLogger(
             delegatee class.
         """
         final_cmd_name = cmd_name or self.cmd_name
-        self.logger_impl.cmd(msg, *args, cmd_name=final_cmd_name, **kwargs)
+        self._logger_impl.cmd(msg, *args, cmd_name=final_cmd_name, **kwargs)
 
 
 class DirectAllLevelLogger(BaseDirectStdAllLevelLogger):
+    __slots__ = ()
+
     def __init__(
         self,
         logger_impl: BaseDirectStdAllLevelLoggerImpl,
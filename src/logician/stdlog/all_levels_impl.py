@@ -31,6 +31,8 @@ class StdProtocolAllLevelLoggerImpl(AllLevelLoggerImplABC[L], Protocol):
     Interface for all logging levels provided by the standard logging protocol.
     """
 
+    __slots__ = ()
+
     @override
     @property
     @abstractmethod
@@ -55,6 +57,8 @@ class BaseDirectStdAllLevelLoggerImpl(StdProtocolAllLevelLoggerImpl, Protocol):
     Interface for all logging levels provided by the python standard logging library.
     """
 
+    __slots__ = ()
+
     @override
     @property
     @abstractmethod
@@ -63,6 +67,8 @@ class BaseDirectStdAllLevelLoggerImpl(StdProtocolAllLevelLoggerImpl, Protocol):
 
 
 class DirectAllLevelLoggerImpl(BaseDirectStdAllLevelLoggerImpl):
+    __slots__ = ("_underlying_logger", "stack_level")
+
     def __init__(self, underlying_logger: Logger, stack_level=INDIRECTION_STACK_LEVEL):
         """
         Basic logger that implements all the logging levels of python standard logging and simply delegates method
@@ -72,6 +78,8 @@ class DirectAllLevelLoggerImpl(BaseDirectStdAllLevelLoggerImpl):
         :param stack_level: stack to go up to get the file/line/func information from the framing stack.
             Check ``DEFAULT_STACK_LEVEL`` for more details.
         """
+        # log calls use _underlying_logger directly, not the underlying_logger property, as they run on every log call.
+        # Level filtering is left to the std logger whose isEnabledFor() is already cached per level.
         self._underlying_logger = underlying_logger
         self.stack_level = stack_level
 
@@ -111,73 +119,73 @@ class DirectAllLevelLoggerImpl(BaseDirectStdAllLevelLoggerImpl):
 
         :return: whether the traceback processing (in most cases, logging) is enabled.
         """
-        return self.underlying_logger.level <= EXCEPTION_TRACEBACK_LOG_LEVEL
+        return self._underlying_logger.level <= EXCEPTION_TRACEBACK_LOG_LEVEL
 
     @override
     def trace(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.log(
+        self._underlying_logger.log(
             TRACE_LOG_LEVEL, msg, *args, stacklevel=self.stack_level, **kwargs
         )
 
     @override
     def debug(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.debug(msg, *args, stacklevel=self.stack_level, **kwargs)
+        self._underlying_logger.debug(msg, *args, stacklevel=self.stack_level, **kwargs)
 
     @override
     def info(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.info(msg, *args, stacklevel=self.stack_level, **kwargs)
+        self._underlying_logger.info(msg, *args, stacklevel=self.stack_level, **kwargs)
 
     @override
     def success(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.log(
+        self._underlying_logger.log(
             SUCCESS_LOG_LEVEL, msg, *args, stacklevel=self.stack_level, **kwargs
         )
 
     @override
     def notice(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.log(
+        self._underlying_logger.log(
             NOTICE_LOG_LEVEL, msg, *args, stacklevel=self.stack_level, **kwargs
         )
 
     @override
     def cmd(self, msg, *args, cmd_name: str | None = None, **kwargs) -> None:
-        if self.underlying_logger.isEnabledFor(CMD_LOG_LEVEL):
+        if self._underlying_logger.isEnabledFor(CMD_LOG_LEVEL):
             with TempSetCmdLvlName(cmd_name):
-                self.underlying_logger.log(
+                self._underlying_logger.log(
                     CMD_LOG_LEVEL, msg, *args, stacklevel=self.stack_level, **kwargs
                 )
 
     @override
     def warning(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.warning(
+        self._underlying_logger.warning(
             msg, *args, stacklevel=self.stack_level, **kwargs
         )
 
     @override
     def error(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.error(msg, *args, stacklevel=self.stack_level, **kwargs)
+        self._underlying_logger.error(msg, *args, stacklevel=self.stack_level, **kwargs)
 
     @override
     def critical(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.critical(
+        self._underlying_logger.critical(
             msg, *args, stacklevel=self.stack_level, **kwargs
         )
 
     @override
     def fatal(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.log(
+        self._underlying_logger.log(
             FATAL_LOG_LEVEL, msg, *args, stacklevel=self.stack_level, **kwargs
         )
 
     @override
     def exception(self, msg, *args, **kwargs) -> None:
-        self.underlying_logger.exception(
+        self._underlying_logger.exception(
             msg, *args, exc_info=True, stacklevel=self.stack_level, **kwargs
         )
 
     @override
     def log(self, level: L, msg: str, *args, **kwargs) -> None:
-        self.underlying_logger.log(
+        self._underlying_logger.log(
             level, msg, *args, stacklevel=self.stack_level, **kwargs
         )
 
@@ -84,7 +84,7 @@ class StdLevelLogger(
         - exception
     """
 
-    pass
+    __slots__ = ()
 
 
 class DirectStdAllLevelLogger(AllLevelLogger[L], Protocol):
@@ -116,6 +116,8 @@ class DirectStdAllLevelLogger(AllLevelLogger[L], Protocol):
         60 -> FATAL
     """
 
+    __slots__ = ()
+
     @staticmethod
     def register_levels(level_name_map: dict[L, S] | None = None) -> dict[L, S]:
         """
@@ -165,8 +167,15 @@ class DirectStdAllLevelLogger(AllLevelLogger[L], Protocol):
 
     @staticmethod
     def __register_all_levels(level_name_map: dict[L, S]):
-        for level in level_name_map:
-            logging.addLevelName(level, level_name_map[level])
+        level_to_name = logging._levelToName
+        name_to_level = logging._nameToLevel
+        for level, level_name in level_name_map.items():
+            # addLevelName() takes the logging module lock, skip it for levels already registered under this name.
+            if (
+                level_to_name.get(level) != level_name
+                or name_to_level.get(level_name) != level
+            ):
+                logging.addLevelName(level, level_name)
 
     @override
     @property
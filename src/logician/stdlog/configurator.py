@@ -7,6 +7,7 @@ Logger interfaces for standard Logger configurators.
 """
 
 import logging
+from types import MappingProxyType
 from typing import override, overload, Protocol, IO
 
 from vt.utils.errors.warnings import vt_warn
@@ -54,6 +55,17 @@ class StdLoggerConfigurator(LevelLoggerConfigurator[E]):
     NO_WARN_FALSE = False
     PROPAGATE_FALSE = False
 
+    __slots__ = (
+        "_level",
+        "cmd_name",
+        "handlr_cfgr",
+        "level_name_map",
+        "no_warn",
+        "propagate",
+        "stream_fmt_mapper",
+        "stream_fmt_mapper_computer",
+    )
+
     @overload
     def __init__(
         self,
@@ -214,10 +226,9 @@ class StdLoggerConfigurator(LevelLoggerConfigurator[E]):
                 case L():  # typically int
                     int_level = level
                 case S():  # typically str
+                    # read the std lib's registry directly, getLevelNamesMapping() copies it on every call.
                     int_level = (
-                        L(level)
-                        if level.isdigit()
-                        else logging.getLevelNamesMapping()[level]
+                        L(level) if level.isdigit() else logging._nameToLevel[level]
                     )
                 case None:
                     int_level = StdLoggerConfigurator.LOG_LEVEL_DEFAULT_SUCCESS
@@ -380,25 +391,39 @@ class VQLoggerConfigurator(
         ``F`` - python std log logging format type, typically ``str``.
     """
 
-    VQ_LEVEL_MAP: VQ_DICT_LITERAL[E] = dict(
-        v=logging.INFO,
-        vv=logging.DEBUG,
-        vvv=TRACE_LOG_LEVEL,
-        q=logging.ERROR,
-        qq=logging.CRITICAL,
-        qqq=FATAL_LOG_LEVEL,
+    VQ_LEVEL_MAP: VQ_DICT_LITERAL[E] = MappingProxyType(
+        dict(
+            v=logging.INFO,
+            vv=logging.DEBUG,
+            vvv=TRACE_LOG_LEVEL,
+            q=logging.ERROR,
+            qq=logging.CRITICAL,
+            qqq=FATAL_LOG_LEVEL,
+        )
     )
     """
-    Default {``verbosity-quietness -> logging-level``} mapping.
+    Default {``verbosity-quietness -> logging-level``} mapping. Read-only as it is shared by all the configurators that
+    are not supplied a ``vq_level_map``.
     """
     LOG_LEVEL_DEFAULT_SUCCESS: E = DEFAULT_LOG_LEVEL_SUCCESS
 
+    __slots__ = ()
+
 
 class VQSepLoggerConfigurator(VQLoggerConfigurator):
     VQ_LEVEL_MAP_NONE = None
     VQ_SEP_CONF_NONE = None
     LOG_LEVEL_DEFAULT_SUCCESS = VQLoggerConfigurator.LOG_LEVEL_DEFAULT_SUCCESS
 
+    __slots__ = (
+        "_underlying_configurator",
+        "_vq_level_map",
+        "default_log_level",
+        "quietness",
+        "verbosity",
+        "vq_sep_configurator",
+    )
+
     @overload
     def __init__(
         self,
@@ -469,6 +494,11 @@ class VQSepLoggerConfigurator(VQLoggerConfigurator):
         >>> vq_log = VQSepLoggerConfigurator(StdLoggerConfigurator(), 'v', None)
         >>> assert vq_log.vq_level_map == VQSepLoggerConfigurator.VQ_LEVEL_MAP
 
+        The shared default mapping is read-only, so it cannot be altered for all the other configurators
+        >>> vq_log.vq_level_map['v'] = logging.DEBUG # type: ignore[index]
+        Traceback (most recent call last):
+        TypeError: 'mappingproxy' object does not support item assignment
+
         ``int`` can be supplied for verbosity value
         ------------------------------------------
 
@@ -636,6 +666,14 @@ class VQCommLoggerConfigurator(
     VQ_COMM_CONF_NONE = None
     LOG_LEVEL_DEFAULT_SUCCESS = VQLoggerConfigurator.LOG_LEVEL_DEFAULT_SUCCESS
 
+    __slots__ = (
+        "_underlying_configurator",
+        "_vq_level_map",
+        "default_log_level",
+        "ver_qui",
+        "vq_comm_configurator",
+    )
+
     def __init__(
         self,
         ver_qui: V_LITERAL | Q_LITERAL | None,
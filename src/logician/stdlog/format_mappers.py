@@ -70,6 +70,7 @@ class StdStrFmtMprComputer(StdStreamFormatMapperComputer):
         >>> ret_dict = sut.compute(False, {sys.stdout, sys.stderr})
         >>> assert isinstance(ret_dict[sys.stderr], StdLogAllLevelDiffFmt)
         >>> assert isinstance(ret_dict[sys.stderr], StdLogAllLevelDiffFmt)
+        >>> assert ret_dict[sys.stdout] is ret_dict[sys.stderr]   # one level-format shared across streams
 
       * ``None`` ``stream_set`` and ``same_fmt_per_level`` enforces different-format-per-log-level on the stderr stream.
 
@@ -84,14 +85,16 @@ class StdStrFmtMprComputer(StdStreamFormatMapperComputer):
         self, same_fmt_per_lvl: F | bool | None, stream_set: set[IO] | None
     ) -> dict[IO, StdLogLevelFmt]:
         if stream_set is not None:  # accepts empty stream_set
+            # level-formats are stateless, hence a single one is shared by all the streams.
+            lvl_fmt: StdLogLevelFmt
             if same_fmt_per_lvl:
                 if isinstance(same_fmt_per_lvl, F):
-                    return {
-                        stream: StdLogAllLevelSameFmt(same_fmt_per_lvl)
-                        for stream in stream_set
-                    }
-                return {stream: StdLogAllLevelSameFmt() for stream in stream_set}
-            return {stream: StdLogAllLevelDiffFmt() for stream in stream_set}
+                    lvl_fmt = StdLogAllLevelSameFmt(same_fmt_per_lvl)
+                else:
+                    lvl_fmt = StdLogAllLevelSameFmt()
+            else:
+                lvl_fmt = StdLogAllLevelDiffFmt()
+            return dict.fromkeys(stream_set, lvl_fmt)
         else:
             if same_fmt_per_lvl:
                 if isinstance(same_fmt_per_lvl, F):
@@ -9,7 +9,11 @@ from abc import abstractmethod
 from typing import Protocol, IO, override
 
 from logician.formatters import LogLevelFmt
-from logician.stdlog.utils import form_stream_handlers_map, add_new_formatter
+from logician.stdlog.utils import (
+    form_stream_handlers_map,
+    add_new_formatter,
+    formatter_with_fmt,
+)
 from logician.stdlog.constants import LOG_LVL as L, LOG_FMT as F
 
 
@@ -102,27 +106,24 @@ class SimpleHandlerConfigurator(HandlerConfigurator):
             logger.addHandler(logging.NullHandler())
         else:
             stream_handlers_map = form_stream_handlers_map(logger)
-            for stream in stream_fmt_map:
-                lvl_fmt_handlr = stream_fmt_map[stream]
+            add_handler = logger.addHandler
+            for stream, lvl_fmt_handlr in stream_fmt_map.items():
                 fmt = lvl_fmt_handlr.fmt(level)  # obtain format for the required level
-                if (
-                    stream in stream_handlers_map
-                ):  # handler already present for the current stream, as stream -> list[handler]
-                    if stream_handlers_map[
-                        stream
-                    ]:  # handlers are already configured for this stream, as stream -> [handler1, handler2, ..., handlerN]
-                        handlr = stream_handlers_map[stream][0]  # get the first handler
-                        if handlr.formatter:  # handler already has a formatter
-                            handlr.formatter._fmt = fmt
-                        else:  # no formatter configured for the handler
-                            handlr.setFormatter(
-                                logging.Formatter(fmt=fmt)
-                            )  # configure formatter for this handler
-                    else:  # no handler configured for the required stream, as stream -> [], empty handler list or no handlers
-                        logger.addHandler(add_new_formatter(stream, fmt))
-                else:  # handlers not present for the current stream, as no stream->list[handlers] mapping present in the logger
-                    # introduce a new handler
-                    logger.addHandler(add_new_formatter(stream, fmt))
+                # handlers already configured for this stream, as stream -> [handler1, handler2, ..., handlerN]
+                handlrs = stream_handlers_map.get(stream)
+                if handlrs is not None:  # mapped handler lists are never empty
+                    handlr = handlrs[0]  # get the first handler
+                    formatter = handlr.formatter
+                    if formatter:  # handler already has a formatter
+                        # only set a new formatter if the format changed.
+                        if formatter._fmt != fmt:
+                            handlr.setFormatter(formatter_with_fmt(formatter, fmt))
+                    else:  # no formatter configured for the handler
+                        handlr.setFormatter(
+                            logging.Formatter(fmt=fmt)
+                        )  # configure formatter for this handler
+                else:  # no handlers present for the current stream, introduce a new handler
+                    add_handler(add_new_formatter(stream, fmt))
 
 
 # TODO: hava a handler configurator that does not affect existing handlers of the logger which are configured outside
@@ -5,23 +5,48 @@
 Important utilities for std python logging library.
 """
 
+import copy
 import logging
 from logging import Handler
 from typing import IO
-from collections import defaultdict
 
 from vt.utils.errors.warnings import vt_warn
 from logician.stdlog.constants import LOG_LVL as L, LOG_FMT as F, LOG_STR_LVL as S
 
 
+_level_name_cache: tuple[dict[int, str], dict[L, S]] | None = None
+"""
+Snapshot of std lib's level -> name registry and the ``level_name_mapping()`` computed from it.
+"""
+
+
 def level_name_mapping() -> dict[L, S]:
     """
+    The mapping is cached and only recomputed once a level or a level name is (re)registered in the std lib, by
+    ``logging.addLevelName()`` or otherwise.
+
+    Examples:
+
+    >>> assert level_name_mapping()[logging.INFO] == "INFO"
+    >>> logging.addLevelName(logging.INFO, "INFORMATION")
+    >>> assert level_name_mapping()[logging.INFO] == "INFORMATION"
+    >>> logging.addLevelName(logging.INFO, "INFO")
+
     :return: level -> name mapping from std lib.
     """
-    return {
-        level: logging.getLevelName(level)
-        for level in sorted(logging.getLevelNamesMapping().values())
-    }
+    global _level_name_cache
+    # std lib keeps no version of its level registry, so the cache is validated against a snapshot of the registry.
+    # A C-level dict comparison is much cheaper than sorting and a getLevelName() call per level.
+    level_to_name = logging._levelToName
+    if _level_name_cache is None or _level_name_cache[0] != level_to_name:
+        _level_name_cache = (
+            level_to_name.copy(),
+            {
+                level: logging.getLevelName(level)
+                for level in sorted(logging.getLevelNamesMapping().values())
+            },
+        )
+    return _level_name_cache[1].copy()
 
 
 class TempSetLevelName:
@@ -46,10 +71,12 @@ class TempSetLevelName:
         self.reverting_lvl_name = reverting_lvl_name
         self.no_warn = no_warn
         self.original_level_name = logging.getLevelName(level)
+        # level name to revert to on exit, decided once here rather than on every exit.
+        self._revert_to = reverting_lvl_name if level_name else self.original_level_name
 
     def __enter__(self):
         if self.level_name is not None:
-            if self.level_name.strip() == "":
+            if not self.level_name or self.level_name.isspace():
                 self.warn_user()
             else:
                 logging.addLevelName(self.level, self.level_name)
@@ -66,25 +93,28 @@ class TempSetLevelName:
         vt_warn(f"Supplied log level name for log level {self.level} is empty.")
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.level_name:
-            logging.addLevelName(self.level, self.reverting_lvl_name)
-        else:
-            logging.addLevelName(self.level, self.original_level_name)
+        # addLevelName() takes the logging module lock, skip it if the level already has the name to revert to.
+        if logging.getLevelName(self.level) != self._revert_to:
+            logging.addLevelName(self.level, self._revert_to)
 
 
 def form_stream_handlers_map(logger: logging.Logger) -> dict[IO, list[Handler]]:
     """
     :param logger: the logger whose stream->list[handlers] mapping is to be obtained.
-    :return: stream->list[handlers] mapping for the supplied logger.
+    :return: stream->list[handlers] mapping for the supplied logger. Only streams having handlers are mapped, hence a
+        mapped list of handlers is never empty.
     """
-    stream_handler_map: dict[IO, list[Handler]] = defaultdict(list)
+    stream_handler_map: dict[IO, list[Handler]] = {}
     """
     Map of logger's stream and its handlers.
     """
     # Create a mapping of stream->list[handlers for that stream]
+    # names bound to locals as this runs on every logger configuration, setdefault() avoids defaultdict's factory call.
+    setdefault = stream_handler_map.setdefault
+    stream_handler = logging.StreamHandler
     for handlr in logger.handlers:
-        if isinstance(handlr, logging.StreamHandler):
-            stream_handler_map[handlr.stream].append(handlr)
+        if isinstance(handlr, stream_handler):
+            setdefault(handlr.stream, []).append(handlr)
     return stream_handler_map
 
 
@@ -106,3 +136,32 @@ def add_new_formatter(stream: IO, fmt: F) -> logging.StreamHandler:
     _handlr = logging.StreamHandler(stream=stream)  # type: ignore[arg-type]
     _handlr.setFormatter(logging.Formatter(fmt=fmt))
     return _handlr
+
+
+def formatter_with_fmt(formatter: logging.Formatter, fmt: F) -> logging.Formatter:
+    """
+    Get a copy of ``formatter`` that formats in ``fmt``.
+
+    The copy keeps the type of the ``formatter``, its ``datefmt``, ``style`` and ``defaults``, unlike a new
+    ``logging.Formatter``. The ``formatter`` itself is left as is as it may be shared by other handlers.
+
+    Examples:
+
+    >>> class MyFormatter(logging.Formatter): ...
+    >>> fmtr = MyFormatter("{name}", datefmt="%H", style="{", defaults={"app": "my-app"})
+    >>> new_fmtr = formatter_with_fmt(fmtr, "{app}: {message}")
+    >>> assert type(new_fmtr) is MyFormatter and new_fmtr.datefmt == "%H"
+    >>> new_fmtr.format(logging.makeLogRecord({"msg": "hi"}))
+    'my-app: hi'
+    >>> assert fmtr._fmt == "{name}"   # type: ignore[attr-defined]
+
+    :param formatter: the formatter to copy.
+    :param fmt: the copy formats in this format.
+    :return: a copy of ``formatter`` that formats in ``fmt``.
+    """
+    new_formatter = copy.copy(formatter)
+    # the formatter formats through its _style, hence it is rebuilt for the new format too.
+    style = formatter._style
+    new_formatter._style = type(style)(fmt, defaults=style._defaults)  # type: ignore[attr-defined]
+    new_formatter._fmt = new_formatter._style._fmt
+    return new_formatter
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Tests for the logger-configurator observability repo.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from logician import _repo
+from logician._repo import (
+    ConstTmpDirFPP,
+    DictRepo,
+    IniFilePathProvider,
+    JSONFilePersister,
+    PyprojectFilePathProvider,
+)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_persister(request, tmp_path: Path, monkeypatch) -> JSONFilePersister:
+    """
+    Persister for each JSON backend, ``orjson`` and the std ``json`` fallback used when ``orjson`` is not installed.
+    """
+    if request.param == "json":
+        monkeypatch.setattr(_repo, "orjson", None)
+    elif _repo.orjson is None:
+        pytest.skip("orjson is not installed")
+    return JSONFilePersister(ConstTmpDirFPP(tmp_path / "repo.json"))
+
+
+class TestJSONFilePersister:
+    def test_commit_reload_round_trip(self, json_persister):
+        ds = {
+            "lgr": {"env_list": ["ENV", "LGCN_ALL_LOG"], "level_list": [None, "10"]},
+            "lgr.c": {"level": 20, "propagate": False},
+        }
+        json_persister.commit(ds)
+        assert json_persister.reload() == ds
+
+    def test_non_str_keys_coerced_to_str(self, json_persister):
+        json_persister.commit({"lgr": {1: None, None: True, 2.5: "x"}})
+        assert json_persister.reload() == {"lgr": {"1": None, "null": True, "2.5": "x"}}
+
+    def test_written_file_readable_by_other_backend(self, json_persister):
+        import json
+
+        ds = {"lgr": {"level": 10, "env_list": ["ENV"]}}
+        json_persister.commit(ds)
+        assert json.loads(json_persister.file_path.read_text(encoding="utf-8")) == ds
+
+    def test_reload_empty_file(self, json_persister):
+        json_persister.init()
+        assert json_persister.reload() == {}
+
+    def test_init_keeps_existing_payload(self, json_persister):
+        json_persister.commit({"lgr": {"level": 10}})
+        json_persister.init()
+        assert json_persister.reload() == {"lgr": {"level": 10}}
+
+
+class TestDictRepo:
+    def test_commit_then_reload_in_another_repo(self, json_persister):
+        repo = DictRepo(json_persister)
+        repo.init()
+        repo.index("lgr", level=10)
+        repo.index("lgr", propagate=True)
+        repo.commit()
+
+        other = DictRepo(json_persister)
+        other.reload()
+        assert other.read_all() == {"lgr": {"level": 10, "propagate": True}}
+
+    def test_init_reaches_persister_once(self, json_persister, monkeypatch):
+        calls = []
+        monkeypatch.setattr(json_persister, "init", lambda: calls.append(1))
+        repo = DictRepo(json_persister)
+        repo.init()
+        repo.init()
+        assert calls == [1]
+
+    def test_index_after_reload(self, json_persister):
+        repo = DictRepo(json_persister)
+        repo.init()
+        repo.reload()
+        repo.index("new-lgr", level=10)
+        assert repo.read("new-lgr") == {"level": 10}
+        assert repo.read("absent-lgr") == {}
+
+    def test_clear(self, json_persister):
+        repo = DictRepo(json_persister)
+        repo.init()
+        repo.index("lgr", level=10)
+        repo.commit()
+        repo.clear()
+        assert repo.read_all() == {}
+        repo.reload()
+        assert repo.read_all() == {"lgr": {"level": 10}}
+
+    def test_reads_are_independent_copies(self, json_persister):
+        repo = DictRepo(json_persister)
+        repo.index("lgr", level=10)
+        repo.read("lgr")["level"] = 20
+        repo.read_all()["lgr"]["level"] = 30
+        repo.read_all()["other-lgr"] = {"level": 40}
+        assert repo.read_all() == {"lgr": {"level": 10}}
+        assert repo.read("absent-lgr") == {}
+        assert "absent-lgr" not in repo.read_all()  # reading does not index
+
+
+class TestFilePathProviderDefaults:
+    def test_tmp_dir_resolved_at_construction(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_repo.tempfile, "tempdir", str(tmp_path))
+        assert ConstTmpDirFPP().get_path().parent == tmp_path
+
+    def test_cwd_resolved_at_construction(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        fpp = ConstTmpDirFPP(tmp_path / "repo.json")
+        assert IniFilePathProvider(fpp).ini_file_path.parent == tmp_path
+        assert PyprojectFilePathProvider(fpp).pyproject_file_path.parent == tmp_path
@@ -113,3 +113,18 @@ def test_ctx_mgr_not_called_when_cmd_lvl_disabled(cmd_lvl_name):
         cmd_lvl_name = "CMD"
         logger.cmd("Command logged", cmd_name=cmd_lvl_name)
         mocked_fn.assert_not_called()
+
+
+def test_logger_attrs_write_through_to_std_logger(request):
+    from logician import get_direct_all_level_logger
+
+    std_lgr = logging.getLogger(request.node.name)
+    lgr = get_direct_all_level_logger(std_lgr)
+    std_lgr.setLevel(logging.ERROR)
+    assert lgr.level == logging.ERROR
+    lgr.level = logging.DEBUG
+    assert std_lgr.level == logging.DEBUG
+    assert std_lgr.isEnabledFor(logging.DEBUG)
+    lgr.disabled = True
+    assert std_lgr.disabled
+    lgr.disabled = False
@@ -10,6 +10,7 @@ import logging
 
 from logician import DirectStdAllLevelLogger
 from logician.configurators.vq.base import SimpleWarningVQLevelOrDefault
+from logician.stdlog import NOTICE_LOG_LEVEL
 from logician.stdlog.utils import level_name_mapping
 
 
@@ -69,6 +70,29 @@ def test_registers_default_if_not_provided(level_name_map):
         )
 
 
+def test_skips_re_registering_unchanged_levels(monkeypatch):
+    DirectStdAllLevelLogger.register_levels()
+    registered = []
+    add_level_name = logging.addLevelName
+
+    def spy(level, level_name):
+        registered.append(level)
+        add_level_name(level, level_name)
+
+    monkeypatch.setattr(logging, "addLevelName", spy)
+    DirectStdAllLevelLogger.register_levels()
+    assert registered == []
+
+    # a level renamed elsewhere is registered again.
+    add_level_name(NOTICE_LOG_LEVEL, "NOTICE-RENAMED-ELSEWHERE")
+    registered_levels = DirectStdAllLevelLogger.register_levels()
+    assert registered == [NOTICE_LOG_LEVEL]
+    assert (
+        registered_levels[NOTICE_LOG_LEVEL]
+        == DirectStdAllLevelLogger.DEFAULT_LEVEL_MAP[NOTICE_LOG_LEVEL]
+    )
+
+
 class TestSimpleWarningVQLevelOrDefault:
     def test_warns_user_by_default(self):
         s = SimpleWarningVQLevelOrDefault[int]({"v": 10, "vv": 20})
@@ -38,6 +38,15 @@ class TestSimpleHandlerFormatter:
             lgr1.handlers[0], logging.NullHandler
         )  # only NullHandler remains
 
+    def test_empty_map_reconfigure_keeps_single_null_handler(self, request):
+        lgr1 = logging.getLogger(request.node.name)
+        lgr2 = logging.getLogger(f"{request.node.name}.other")
+        for lgr in (lgr1, lgr1, lgr2):
+            SimpleHandlerConfigurator().configure(logging.INFO, lgr, {})
+        assert len(lgr1.handlers) == 1
+        # each logger gets its own NullHandler so that filters or levels set on one do not leak into the others.
+        assert lgr1.handlers[0] is not lgr2.handlers[0]
+
     def test_handler_added_if_no_handler_configured(self, request):
         """
         Stream handler is added if handlers are not already configured for a stream
@@ -129,6 +138,25 @@ class TestSimpleHandlerFormatter:
             str_hn_map = form_stream_handlers_map(lgr)
             assert "%(name)s" == str_hn_map[sys.stdout][0].formatter._fmt  # type: ignore[attr-defined] 0th handler reconfigured to include the supplied format.
 
+        def test_first_handler_formats_in_updated_fmt(self, stdout_3_handlr_logger):
+            lgr = stdout_3_handlr_logger
+            SimpleHandlerConfigurator().configure(
+                logging.DEBUG, lgr, {sys.stdout: StdLogAllLevelSameFmt("%(name)s")}
+            )
+            handlr = form_stream_handlers_map(lgr)[sys.stdout][0]
+            record = lgr.makeRecord(
+                lgr.name, logging.INFO, __file__, 1, "msg", (), None
+            )
+            assert handlr.format(record) == lgr.name
+
+        def test_unchanged_fmt_keeps_formatter(self, stdout_3_handlr_logger):
+            lgr = stdout_3_handlr_logger
+            formatter = form_stream_handlers_map(lgr)[sys.stdout][0].formatter
+            SimpleHandlerConfigurator().configure(
+                logging.DEBUG, lgr, {sys.stdout: StdLogAllLevelSameFmt(SHORTER_LOG_FMT)}
+            )
+            assert form_stream_handlers_map(lgr)[sys.stdout][0].formatter is formatter
+
         def test_other_handlers_not_updated(self, stdout_3_handlr_logger):
             """
             No other handler is updated
@@ -146,6 +174,25 @@ class TestSimpleHandlerFormatter:
                 if hn.formatter
             )  # type: ignore[attr-defined]
 
+    def test_changed_fmt_keeps_formatter_type_and_style(self, request):
+        class BraceFormatter(logging.Formatter):
+            pass
+
+        lgr = logging.getLogger(request.node.name)
+        handlr = logging.StreamHandler(sys.stdout)
+        formatter = BraceFormatter("{message}", datefmt="%H", style="{")
+        handlr.setFormatter(formatter)
+        lgr.addHandler(handlr)
+        SimpleHandlerConfigurator().configure(
+            logging.DEBUG, lgr, {sys.stdout: StdLogAllLevelSameFmt("{name}: {message}")}
+        )
+        new_formatter = handlr.formatter
+        assert type(new_formatter) is BraceFormatter
+        assert new_formatter.datefmt == "%H"
+        record = lgr.makeRecord(lgr.name, logging.INFO, __file__, 1, "msg", (), None)
+        assert new_formatter.format(record) == f"{lgr.name}: msg"
+        assert formatter._fmt == "{message}"  # the replaced formatter is left as is
+
     def test_logger_has_handler_added_but_fmtr_not_configured(self, request):
         """
         Adds the required formatter to the logger's handler if:
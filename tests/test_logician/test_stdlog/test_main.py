@@ -2,10 +2,131 @@
 Tests for main.py file.
 """
 
+import json
+import logging
+import os
+import shlex
+import subprocess
+import sys
+
 import pytest
 from vt.utils.errors.error_specs import ERR_INVALID_USAGE
 
-from logician.main import cli
+from logician import main as lgcn_main
+from logician.errors import LogicianCmdException, LogicianExitingException
+from logician.main import cli, main
+
+
+def py_cmd(code: str) -> str:
+    """
+    :return: a command that runs python ``code`` in a child interpreter.
+    """
+    return shlex.join([sys.executable, "-c", code])
+
+
+def lgcn_script(lgr_name: str, env: str) -> str:
+    """
+    :return: python code that configures logger ``lgr_name`` using logician, heeding env var ``env``.
+    """
+    return (
+        "import logging;"
+        "from logician.configurators.env import LgcnEnvListLC;"
+        "from logician.stdlog.configurator import StdLoggerConfigurator;"
+        f"LgcnEnvListLC([{env!r}], StdLoggerConfigurator())"
+        f".configure(logging.getLogger({lgr_name!r}))"
+    )
+
+
+def lgcn_cmd(lgr_name: str, env: str) -> str:
+    """
+    :return: a command that configures logger ``lgr_name`` using logician, heeding env var ``env``.
+    """
+    return py_cmd(lgcn_script(lgr_name, env))
+
+
+class TestMain:
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        return tmp_path
+
+    def test_details_do_not_leak_across_commands(self):
+        lgcn = lgcn_cmd("lgr", "ENV_LGR")
+        no_lgcn = py_cmd("pass")
+        info = main(lgcn, no_lgcn)
+        assert list(info) == [lgcn, no_lgcn]
+        assert info[lgcn]["lgr"]["env_list"] == ["ENV_LGR", "LGCN_ALL_LOG"]
+        assert info[no_lgcn] == {}
+
+    def test_details_are_json_serialisable(self):
+        lgcn = lgcn_cmd("lgr", "ENV_LGR")
+        info = main(lgcn)
+        assert json.loads(json.dumps(info)) == info
+
+    def test_failing_command(self):
+        with pytest.raises(LogicianCmdException, match="cmd-err"):
+            main(py_cmd("raise SystemExit('cmd-err')"))
+
+    @pytest.mark.parametrize("command", ["", "  "])
+    def test_empty_command(self, command):
+        with pytest.raises(LogicianExitingException, match="Empty command"):
+            main(command)
+
+    def test_cached_details_are_reused(self, monkeypatch):
+        lgcn = lgcn_cmd("lgr", "ENV_LGR")
+        info = main(lgcn, use_cache=True)
+
+        def no_run(*args, **kwargs):
+            raise AssertionError("command must not be run again when cached.")
+
+        monkeypatch.setattr(subprocess, "run", no_run)
+        assert main(lgcn, use_cache=True) == info
+        with pytest.raises(AssertionError, match="must not be run"):
+            main(lgcn)
+
+    def test_cache_is_keyed_on_env(self, monkeypatch):
+        lgcn = lgcn_cmd("lgr", "ENV_LGR")
+        monkeypatch.setenv("ENV_LGR", "DEBUG")
+        assert main(lgcn, use_cache=True)[lgcn]["lgr"]["level"] == logging.DEBUG
+        monkeypatch.setenv("ENV_LGR", "ERROR")
+        assert main(lgcn, use_cache=True)[lgcn]["lgr"]["level"] == logging.ERROR
+
+    def test_cache_is_keyed_on_script(self, tmp_path, monkeypatch):
+        script = tmp_path / "app.py"
+        script.write_text(lgcn_script("lgr", "ENV_LGR"))
+        lgcn = shlex.join([sys.executable, str(script)])
+        assert list(main(lgcn, use_cache=True)[lgcn]) == ["lgr"]
+        script.write_text(lgcn_script("other-lgr", "ENV_OTHER"))
+        assert list(main(lgcn, use_cache=True)[lgcn]) == ["other-lgr"]
+
+    def test_cache_evicts_least_recently_used(self, cache_home, monkeypatch):
+        monkeypatch.setattr(lgcn_main, "_CACHE_MAX_FILES", 1)
+        main(py_cmd("pass"), use_cache=True)
+        main(py_cmd("pass;"), use_cache=True)
+        assert len(list((cache_home / "lgcn").glob("*.json"))) == 1
+
+    def test_cache_evicts_stale_repo_files(self, cache_home):
+        cache_dir = cache_home / "lgcn"
+        cache_dir.mkdir()
+        stale, running = (
+            cache_dir / ".0-LGCN-stale.json",
+            cache_dir / ".0-LGCN-run.json",
+        )
+        stale.touch()
+        running.touch()
+        os.utime(stale, (0, 0))
+        main(py_cmd("pass"), use_cache=True)
+        assert not stale.exists()
+        assert running.exists()
+
+    def test_no_cache_dir_when_home_unknown(self, monkeypatch):
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.setattr(lgcn_main.Path, "home", no_home)
+        lgcn = lgcn_cmd("lgr", "ENV_LGR")
+        assert list(main(lgcn, use_cache=True)[lgcn]) == ["lgr"]
 
 
 class TestCLI: